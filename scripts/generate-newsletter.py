@@ -28,13 +28,16 @@ Configuration File:
     .env            - Optional dotenv file in project root for API keys
 """
 
+import asyncio
 import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 
 import typer
 
@@ -59,6 +62,48 @@ except ImportError:
     OPENAI_AVAILABLE = False
 
 
+# Maximum number of commits summarized in the prompt
+MAX_COMMITS = 50
+
+# Maximum number of changelog characters included in the prompt
+MAX_CHANGELOG_CHARS = 3000
+
+# Precompiled patterns, shared across calls and files
+_VERSION_RE = re.compile(r'## \[(\d+\.\d+\.\d+)\] - (\d{4}-\d{2}-\d{2})')
+_CMD_DECL_RE = re.compile(r'var\s+(\w+Cmd)\s*=\s*&cobra\.Command\{')
+_USE_RE = re.compile(r'Use:\s*["\']([^"\']+)["\']')
+_SHORT_RE = re.compile(r'Short:\s*["\']([^"\']+)["\']')
+_BREAKING_HEADER_RE = re.compile(r'###\s+Breaking[^\n]*\n', re.IGNORECASE)
+_BREAKING_ITEM_RE = re.compile(r'^[-*]\s+\*\*([^*]+)\*\*\s*(?:-\s+)?([^\n]*)', re.MULTILINE)
+
+
+# Known models, most specific substring first:
+# (substring, (input_price_per_1m, output_price_per_1m), display name)
+_MODEL_TABLE: list[tuple[str, tuple[float, float], str]] = [
+    # Anthropic models
+    ('opus-4-1', (15.0, 45.0), 'claude-opus-4-1'),
+    ('opus-4.1', (15.0, 45.0), 'claude-opus-4-1'),
+    ('opus', (15.0, 45.0), 'claude-opus'),
+    ('sonnet-4-5', (3.0, 15.0), 'claude-sonnet-4-5'),
+    ('sonnet', (3.0, 15.0), 'claude-sonnet'),
+    ('haiku-4-5', (0.80, 4.0), 'claude-haiku-4-5'),
+    ('haiku', (0.80, 4.0), 'claude-haiku'),
+    # OpenAI models
+    ('gpt-4o', (5.0, 15.0), 'gpt-4o'),
+    ('gpt-4-turbo', (10.0, 30.0), 'gpt-4-turbo'),
+    ('gpt-4', (30.0, 60.0), 'gpt-4'),
+    ('gpt-3.5', (0.50, 1.50), 'gpt-3.5-turbo'),
+]
+
+# Model name substring -> provider; anything unmatched defaults to anthropic
+_PROVIDER_TABLE: list[tuple[str, str]] = [
+    ('claude', 'anthropic'),
+    ('gpt', 'openai'),
+    ('openai', 'openai'),
+    ('o1', 'openai'),  # OpenAI reasoning models
+    ('o3', 'openai'),
+]
+
 # Newsletter prompt template
 NEWSLETTER_PROMPT_TEMPLATE = """Generate a Gas Town newsletter covering the period from {since_date} to {until_date}.
 
@@ -94,15 +139,29 @@ Format in Markdown.
 """
 
 
+class Commit(NamedTuple):
+    """A single commit parsed from git log."""
+    hash: str
+    subject: str
+    author: str
+    date: Optional[str]  # Raw author date as printed by git (%ai)
+
+
+def _git(*args: str, check: bool = False) -> subprocess.CompletedProcess:
+    """Run a git command and capture its output, decoded as UTF-8."""
+    return subprocess.run(
+        ["git", *args],
+        capture_output=True,
+        encoding='utf-8',
+        errors='replace',
+        check=check
+    )
+
+
 def check_git_branch() -> Optional[str]:
     """Check current git branch and warn if not on main."""
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        result = _git("rev-parse", "--abbrev-ref", "HEAD", check=True)
         current_branch = result.stdout.strip()
         return current_branch
     except subprocess.CalledProcessError:
@@ -110,16 +169,21 @@ def check_git_branch() -> Optional[str]:
         return None
 
 
-def get_all_versions() -> list[tuple[str, datetime]]:
-    """Extract all versions and dates from CHANGELOG.md."""
+@lru_cache(maxsize=1)
+def _changelog_content() -> str:
+    """Read CHANGELOG.md once per process."""
     changelog_path = Path(__file__).parent.parent / "CHANGELOG.md"
 
-    with open(changelog_path) as f:
-        content = f.read()
+    return changelog_path.read_bytes().decode('utf-8')
+
+
+@lru_cache(maxsize=1)
+def get_all_versions() -> list[tuple[str, datetime]]:
+    """Extract all versions and dates from CHANGELOG.md."""
+    content = _changelog_content()
 
     # Match version pattern like [0.3.0] - 2026-01-04
-    pattern = r'## \[(\d+\.\d+\.\d+)\] - (\d{4}-\d{2}-\d{2})'
-    matches = re.finditer(pattern, content)
+    matches = _VERSION_RE.finditer(content)
 
     versions = []
     for match in matches:
@@ -133,11 +197,22 @@ def get_all_versions() -> list[tuple[str, datetime]]:
 
 def get_version_by_release(version_str: str) -> tuple[str, datetime]:
     """Find a specific version by version string (e.g., 'v0.3.0' or '0.3.0')."""
-    versions = get_all_versions()
-
     # Normalize the input (remove 'v' prefix if present)
     normalized = version_str.lstrip('v')
 
+    # Fast path: locate the "## [X.Y.Z] - YYYY-MM-DD" header directly
+    content = _changelog_content()
+    needle = f'## [{normalized}] - '
+    idx = content.find(needle)
+    if idx != -1:
+        date_start = idx + len(needle)
+        try:
+            return normalized, datetime.strptime(content[date_start:date_start + 10], "%Y-%m-%d")
+        except ValueError:
+            pass  # Malformed header; fall back to the full parse
+
+    versions = get_all_versions()
+
     for version, date in versions:
         if version == normalized:
             return version, date
@@ -153,58 +228,109 @@ def get_previous_version() -> tuple[str, datetime]:
     raise ValueError("Could not find any versions in CHANGELOG.md")
 
 
-def get_commits_since(since_date: datetime) -> list[dict]:
-    """Get git commits since the given date."""
-    result = subprocess.run(
-        ["git", "log", f"--since={since_date.strftime('%Y-%m-%d')}", "--oneline", "--format=%h|%s|%an|%ai"],
-        capture_output=True,
-        text=True
-    )
+def get_commits_since(since_date: datetime, until_date: Optional[datetime] = None) -> list[Commit]:
+    """Get the most recent git commits since the given date (and up to until_date, inclusive).
+
+    Date filtering and the MAX_COMMITS cap are applied by git itself.
+    """
+    args = ["git", "log", f"--since={since_date.strftime('%Y-%m-%d')}"]
+    if until_date is not None:
+        args.append(f"--until={until_date.strftime('%Y-%m-%d')} 23:59:59")
+    args += [f"--max-count={MAX_COMMITS}", "--oneline", "--format=%h|%s|%an|%ai"]
 
     commits = []
-    for line in result.stdout.strip().split('\n'):
-        if line:
-            parts = line.split('|', 3)
-            if len(parts) >= 2:
-                commit_date = None
-                if len(parts) >= 4:
-                    try:
-                        # Parse as naive datetime (extract just the date part)
-                        date_str = parts[3].strip().split()[0]
-                        commit_date = datetime.strptime(date_str, "%Y-%m-%d")
-                    except (ValueError, AttributeError, IndexError):
-                        pass
-
-                commits.append({
-                    'hash': parts[0],
-                    'subject': parts[1],
-                    'author': parts[2] if len(parts) > 2 else 'unknown',
-                    'date': commit_date,
-                })
+    # Stream git log output so parsing overlaps with git walking history
+    with subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        encoding='utf-8',
+        errors='replace'
+    ) as proc:
+        for line in proc.stdout:
+            line = line.rstrip('\n')
+            if not line:
+                continue
+            # Fixed hash|subject|author|date layout, parsed without building a list
+            commit_hash, sep, rest = line.partition('|')
+            if not sep:
+                continue
+            subject, has_author, rest = rest.partition('|')
+            author, has_date, date = rest.partition('|')
+            commits.append(Commit(
+                hash=commit_hash,
+                subject=subject,
+                author=author if has_author else 'unknown',
+                date=date.strip() if has_date else None,
+            ))
 
     return commits
 
 
 def get_changelog_section(version: str) -> str:
     """Extract the changelog section for a specific version."""
-    changelog_path = Path(__file__).parent.parent / "CHANGELOG.md"
+    content = _changelog_content()
 
-    with open(changelog_path) as f:
-        content = f.read()
+    # Find the section for this version; it runs until the next version header
+    header = f'## [{version}]'
+    start = content.find(header)
+    if start == -1:
+        return ""
 
-    # Find the section for this version
-    pattern = rf'## \[{re.escape(version)}\].*?(?=## \[|\Z)'
-    match = re.search(pattern, content, re.DOTALL)
+    end = content.find('## [', start + len(header))
+    if end == -1:
+        end = len(content)
 
-    if match:
-        return match.group(0)
+    return content[start:end]
 
-    return ""
 
+def _safe_read(path: Path) -> Optional[str]:
+    """Read a file, returning None if it is missing or unreadable."""
+    try:
+        return path.read_bytes().decode('utf-8')
+    except (FileNotFoundError, IOError):
+        return None
+
+
+def _iter_cobra_commands(content: str) -> Iterator[tuple[str, str]]:
+    """Yield (use, short) for each `var fooCmd = &cobra.Command{...}` in Go source.
+
+    Use and Short are only looked up between the opening brace and the first
+    closing brace, so each search is bounded to the head of the struct literal.
+    """
+    if 'cobra.Command' not in content:
+        return
 
+    for decl in _CMD_DECL_RE.finditer(content):
+        block_end = content.find('}', decl.end())
+        if block_end == -1:
+            block_end = len(content)
+
+        use_match = _USE_RE.search(content, decl.end(), block_end)
+        if not use_match:
+            continue
+        short_match = _SHORT_RE.search(content, use_match.end(), block_end)
+        if not short_match:
+            continue
+
+        yield use_match.group(1), short_match.group(1)
+
+
+@lru_cache(maxsize=1)
+def _git_tags() -> frozenset[str]:
+    """List all tag names in the repository."""
+    result = _git("for-each-ref", "--format=%(refname:short)", "refs/tags/")
+    if result.returncode != 0:
+        return frozenset()
+    return frozenset(result.stdout.splitlines())
+
+
+@lru_cache(maxsize=32)
 def extract_new_commands(from_version: str, to_version: str) -> list[dict]:
     """Extract new commands added between versions by diffing cmd/ directory.
 
+    Results are cached per (from_version, to_version); treat them as read-only.
+
     Returns list of dicts with: name, short_desc, file_path
     """
     try:
@@ -213,42 +339,36 @@ def extract_new_commands(from_version: str, to_version: str) -> list[dict]:
         to_ver = to_version.lstrip('v')
 
         # Try with v prefix first, then without
-        for prefix in ['v', '']:
-            result = subprocess.run(
-                ["git", "diff", f"{prefix}{from_ver}..{prefix}{to_ver}", "--name-only", "--", "cmd/gt"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-
-            if result.returncode == 0:
+        tags = _git_tags()
+        for from_ref, to_ref in ((f"v{from_ver}", f"v{to_ver}"), (from_ver, to_ver)):
+            if from_ref in tags and to_ref in tags:
                 break
+        else:
+            # Versions don't exist as tags, return empty
+            return []
+
+        result = _git("diff", f"{from_ref}..{to_ref}", "--name-only", "--", "cmd/gt")
 
         if result.returncode != 0:
-            # Versions don't exist as tags, return empty
             return []
 
-        changed_files = result.stdout.strip().split('\n') if result.stdout.strip() else []
+        changed_files = result.stdout.splitlines()
 
         commands = []
         seen = set()
+        repo_root = Path(__file__).parent.parent
+        go_files = [f for f in changed_files if f and not f.endswith('_test.go')]
 
-        for file_path in changed_files:
-            if not file_path or file_path.endswith('_test.go'):
-                continue
+        # Read the files concurrently; parsing stays in order so results are deterministic
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contents = executor.map(_safe_read, (repo_root / f for f in go_files))
 
-            # Read the file to extract cobra.Command definitions
-            try:
-                full_path = Path(__file__).parent.parent / file_path
-                content = full_path.read_text()
+            for file_path, content in zip(go_files, contents):
+                if content is None:
+                    continue
 
                 # Look for patterns like: var someCmd = &cobra.Command{ ... Use: "commandname" ... Short: "description"
-                cmd_pattern = r'var\s+(\w+Cmd)\s*=\s*&cobra\.Command\{[^}]*?Use:\s*["\']([^"\']+)["\'][^}]*?Short:\s*["\']([^"\']+)["\']'
-                for match in re.finditer(cmd_pattern, content, re.DOTALL):
-                    var_name = match.group(1)
-                    use = match.group(2)
-                    short = match.group(3)
-
+                for use, short in _iter_cobra_commands(content):
                     # Extract just the command name (first word)
                     cmd_name = use.split()[0]
 
@@ -260,17 +380,18 @@ def extract_new_commands(from_version: str, to_version: str) -> list[dict]:
                             'short': short,
                             'file': file_path
                         })
-            except (FileNotFoundError, IOError):
-                continue
 
         return sorted(commands, key=lambda x: x['name'])[:5]  # Top 5
     except (subprocess.CalledProcessError, Exception):
         return []
 
 
+@lru_cache(maxsize=32)
 def extract_breaking_changes(changelog_section: str) -> list[dict]:
     """Extract breaking changes from changelog section.
 
+    Results are cached per section text; treat them as read-only.
+
     Returns list of dicts with: title, description
     """
     if not changelog_section:
@@ -278,15 +399,18 @@ def extract_breaking_changes(changelog_section: str) -> list[dict]:
 
     breaking = []
 
-    # Look for "Breaking" subsection
-    breaking_pattern = r'###\s+Breaking[^\n]*\n(.*?)(?=###|\Z)'
-    breaking_match = re.search(breaking_pattern, changelog_section, re.IGNORECASE | re.DOTALL)
+    # Look for "Breaking" subsection; its body runs until the next ### header
+    header_match = _BREAKING_HEADER_RE.search(changelog_section)
 
-    if breaking_match:
-        breaking_text = breaking_match.group(1)
+    if header_match:
+        body_start = header_match.end()
+        body_end = changelog_section.find('###', body_start)
+        if body_end == -1:
+            body_end = len(changelog_section)
+        breaking_text = changelog_section[body_start:body_end]
         # Split by top-level bullet points (not indented)
         # Matches: - **Title** followed by optional inline description or newline
-        items = re.findall(r'^[-*]\s+\*\*([^*]+)\*\*\s*(?:-\s+)?([^\n]*)', breaking_text, re.MULTILINE)
+        items = _BREAKING_ITEM_RE.findall(breaking_text)
         for title, description in items[:5]:  # Top 5
             # Filter out empty descriptions or nested bullet continuations
             desc = description.strip()
@@ -299,10 +423,29 @@ def extract_breaking_changes(changelog_section: str) -> list[dict]:
     return breaking
 
 
-def find_docs_for_command(command_name: str) -> str:
-    """Find documentation for a command in README, docs/, or CHANGELOG.
+def _excerpt_around(content: str, content_lower: str, needle: str) -> str:
+    """Return ~200 chars of context around the first line mentioning needle."""
+    # Find each line containing this command and take the surrounding context
+    idx = content_lower.find(needle)
+    while idx != -1:
+        line_start = content.rfind('\n', 0, idx) + 1
+        line_end = content.find('\n', idx + len(needle))
+        if line_end == -1:
+            line_end = len(content)
+        start = max(0, line_start - 200)
+        end = min(len(content), line_end + 200)
+        excerpt = content[start:end].strip()
+        if len(excerpt) > 20:  # Filter out noise
+            return excerpt
+        idx = content_lower.find(needle, line_end)
+    return ""
 
-    Returns relevant excerpt or empty string.
+
+def find_docs_for_commands(command_names: list[str]) -> dict[str, str]:
+    """Find documentation for several commands in README or docs/.
+
+    Each file is read once and searched for every command that has no excerpt yet.
+    Returns dict mapping each command name to its excerpt (empty string if none).
     """
     # Search in order of priority
     search_files = [
@@ -314,95 +457,76 @@ def find_docs_for_command(command_name: str) -> str:
     if docs_dir.exists():
         search_files.extend(sorted(docs_dir.glob("*.md")))
 
+    docs = {name: "" for name in command_names}
+    pending = list(docs)
+
+    # Lowercased needle and compiled mention pattern per command, built once for all files
+    matchers = {}
+    for command_name in pending:
+        needle = command_name.lower()
+        escaped = re.escape(needle)
+        matchers[command_name] = (needle, re.compile(rf'`{escaped}`|gt\s+{escaped}'))
+
     for file_path in search_files:
+        if not pending:
+            break
         try:
-            content = file_path.read_text()
-            # Look for command mention with context
-            pattern = rf'`{re.escape(command_name)}`|gt\s+{re.escape(command_name)}'
-            if re.search(pattern, content, re.IGNORECASE):
-                # Find the paragraph/section containing this command
-                matches = re.finditer(rf'[^\n]*{re.escape(command_name)}[^\n]*', content, re.IGNORECASE)
-                for match in matches:
-                    start = max(0, match.start() - 200)
-                    end = min(len(content), match.end() + 200)
-                    excerpt = content[start:end].strip()
-                    if len(excerpt) > 20:  # Filter out noise
-                        return excerpt
+            content = file_path.read_bytes().decode('utf-8')
         except (FileNotFoundError, IOError):
             continue
 
-    return ""
+        content_lower = content.lower()
+        for command_name in list(pending):
+            needle, mention_re = matchers[command_name]
+            # Cheap literal check before running any regex
+            if needle not in content_lower:
+                continue
+            # Look for command mention with context (content_lower is already case-folded)
+            if mention_re.search(content_lower):
+                excerpt = _excerpt_around(content, content_lower, needle)
+                if excerpt:
+                    docs[command_name] = excerpt
+                    pending.remove(command_name)
 
+    return docs
 
-def get_model_pricing(model: str) -> tuple[float, float]:
-    """Get pricing for a model (input_cost, output_cost per 1M tokens).
 
-    Returns tuple of (input_price_per_1m, output_price_per_1m).
-    Prices in dollars per million tokens.
+def find_docs_for_command(command_name: str) -> str:
+    """Find documentation for a command in README, docs/, or CHANGELOG.
+
+    Returns relevant excerpt or empty string.
     """
+    return find_docs_for_commands([command_name])[command_name]
+
+
+def _lookup_model(model: str) -> Optional[tuple[str, tuple[float, float], str]]:
+    """Return the first _MODEL_TABLE row whose substring appears in the model name."""
     model_lower = model.lower()
+    for row in _MODEL_TABLE:
+        if row[0] in model_lower:
+            return row
+    return None
 
-    # Anthropic models
-    if 'opus-4-1' in model_lower or 'opus-4.1' in model_lower:
-        return (15.0, 45.0)
-    elif 'opus' in model_lower:
-        return (15.0, 45.0)
-    elif 'sonnet-4-5' in model_lower:
-        return (3.0, 15.0)
-    elif 'sonnet' in model_lower:
-        return (3.0, 15.0)
-    elif 'haiku-4-5' in model_lower:
-        return (0.80, 4.0)
-    elif 'haiku' in model_lower:
-        return (0.80, 4.0)
 
-    # OpenAI models
-    elif 'gpt-4o' in model_lower:
-        return (5.0, 15.0)
-    elif 'gpt-4-turbo' in model_lower:
-        return (10.0, 30.0)
-    elif 'gpt-4' in model_lower:
-        return (30.0, 60.0)
-    elif 'gpt-3.5' in model_lower:
-        return (0.50, 1.50)
+def get_model_pricing(model: str) -> tuple[float, float]:
+    """Get pricing for a model (input_cost, output_cost per 1M tokens).
 
+    Returns tuple of (input_price_per_1m, output_price_per_1m).
+    Prices in dollars per million tokens.
+    """
+    row = _lookup_model(model)
     # Default: unknown pricing
-    return (0.0, 0.0)
+    return row[1] if row else (0.0, 0.0)
 
 
 def get_model_cost_info(model: str) -> str:
     """Get cost information for a model."""
-    model_lower = model.lower()
-    input_price, output_price = get_model_pricing(model)
-
-    if input_price == 0:
+    row = _lookup_model(model)
+    if row is None:
         return f"{model} (cost unknown)"
 
-    # Anthropic models
-    if 'opus-4-1' in model_lower or 'opus-4.1' in model_lower:
-        return f"claude-opus-4-1 (${input_price}/${output_price} per 1M input/output tokens)"
-    elif 'opus' in model_lower:
-        return f"claude-opus (${input_price}/${output_price} per 1M input/output tokens)"
-    elif 'sonnet-4-5' in model_lower:
-        return f"claude-sonnet-4-5 (${input_price}/${output_price} per 1M input/output tokens)"
-    elif 'sonnet' in model_lower:
-        return f"claude-sonnet (${input_price}/${output_price} per 1M input/output tokens)"
-    elif 'haiku-4-5' in model_lower:
-        return f"claude-haiku-4-5 (${input_price}/${output_price} per 1M input/output tokens)"
-    elif 'haiku' in model_lower:
-        return f"claude-haiku (${input_price}/${output_price} per 1M input/output tokens)"
-
-    # OpenAI models
-    elif 'gpt-4o' in model_lower:
-        return f"gpt-4o (${input_price}/${output_price} per 1M input/output tokens)"
-    elif 'gpt-4-turbo' in model_lower:
-        return f"gpt-4-turbo (${input_price}/${output_price} per 1M input/output tokens)"
-    elif 'gpt-4' in model_lower:
-        return f"gpt-4 (${input_price}/${output_price} per 1M input/output tokens)"
-    elif 'gpt-3.5' in model_lower:
-        return f"gpt-3.5-turbo (${input_price}/${output_price} per 1M input/output tokens)"
-
-    return f"{model} (cost unknown)"
+    _, (input_price, output_price), name = row
+    return f"{name} (${input_price}/${output_price} per 1M input/output tokens)"
 
 
 def calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
@@ -416,14 +540,10 @@ def calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
 def detect_ai_provider(model: str) -> str:
     """Detect AI provider from model name."""
     model_lower = model.lower()
-    if 'claude' in model_lower:
-        return 'anthropic'
-    elif 'gpt' in model_lower or 'openai' in model_lower:
-        return 'openai'
-    elif 'o1' in model_lower or 'o3' in model_lower:
-        return 'openai'  # OpenAI reasoning models
-    else:
-        return 'anthropic'  # Default
+    for substr, provider in _PROVIDER_TABLE:
+        if substr in model_lower:
+            return provider
+    return 'anthropic'  # Default
 
 
 def get_ai_client(provider: str):
@@ -444,15 +564,19 @@ def get_ai_client(provider: str):
         raise ValueError(f"Unknown provider: {provider}")
 
 
-def build_newsletter_prompt(commits: list[dict], changelog: str, version: str, since_date: datetime,
+def build_newsletter_prompt(commits: list[Commit], changelog: str, version: str, since_date: datetime,
                            until_date: datetime = None,
                            new_commands: list[dict] = None, breaking_changes: list[dict] = None,
                            from_version: str = None, to_version: str = None) -> str:
-    """Build the newsletter prompt from components."""
+    """Build the newsletter prompt from components.
+
+    Callers pass commits and changelog already trimmed to MAX_COMMITS and
+    MAX_CHANGELOG_CHARS.
+    """
     if until_date is None:
         until_date = datetime.now()
 
-    commit_summary = "\n".join([f"- {c['subject']}" for c in commits[:50]])
+    commit_summary = "\n".join(f"- {c.subject}" for c in commits)
 
     # Build structured sections
     new_commands_text = ""
@@ -487,13 +611,13 @@ def build_newsletter_prompt(commits: list[dict], changelog: str, version: str, s
         version_info=version_info,
         commit_summary=commit_summary,
         version=version,
-        changelog=changelog[:3000],
+        changelog=changelog,
         new_commands_text=new_commands_text,
         breaking_text=breaking_text,
     )
 
 
-def generate_with_claude(client, commits: list[dict], changelog: str, version: str, since_date: datetime,
+def generate_with_claude(client, commits: list[Commit], changelog: str, version: str, since_date: datetime,
                         until_date: datetime = None,
                         new_commands: list[dict] = None, breaking_changes: list[dict] = None,
                         from_version: str = None, to_version: str = None) -> tuple[str, int, int]:
@@ -516,7 +640,7 @@ def generate_with_claude(client, commits: list[dict], changelog: str, version: s
      return response.content[0].text, input_tokens, output_tokens
 
 
-def generate_with_openai(client, commits: list[dict], changelog: str, version: str, since_date: datetime,
+def generate_with_openai(client, commits: list[Commit], changelog: str, version: str, since_date: datetime,
                          until_date: datetime = None,
                          new_commands: list[dict] = None, breaking_changes: list[dict] = None,
                          from_version: str = None, to_version: str = None) -> tuple[str, int, int]:
@@ -539,6 +663,36 @@ def generate_with_openai(client, commits: list[dict], changelog: str, version: s
      return response.choices[0].message.content, input_tokens, output_tokens
 
 
+async def _gather_newsletter_inputs(
+    since_date: datetime,
+    until_date: datetime,
+    version: Optional[str],
+    from_version: Optional[str],
+    to_version: Optional[str],
+) -> tuple[list[Commit], str, list[dict]]:
+    """Collect commits, changelog section and new commands concurrently.
+
+    Each source shells out to git or reads files, so running them in worker
+    threads overlaps their I/O instead of paying for it serially.
+    """
+    async def changelog() -> str:
+        if version and version != "Newsletter":
+            return await asyncio.to_thread(get_changelog_section, version)
+        return ""
+
+    async def new_commands() -> list[dict]:
+        if from_version and to_version:
+            return await asyncio.to_thread(extract_new_commands, from_version, to_version)
+        return []
+
+    commits, changelog_text, commands = await asyncio.gather(
+        asyncio.to_thread(get_commits_since, since_date, until_date),
+        changelog(),
+        new_commands(),
+    )
+    return commits, changelog_text, commands
+
+
 def generate_newsletter(
     model: Optional[str] = None,
     since_date: Optional[datetime] = None,
@@ -572,29 +726,19 @@ def generate_newsletter(
         if version is None:
             version = "Newsletter"
 
-    # Get commits in the specified date range
-    commits = get_commits_since(since_date)
-    # Filter commits to be before until_date (both are naive datetimes)
-    commits = [c for c in commits if c.get('date') is None or c['date'] <= until_date]
-
-    # Get changelog for this version if applicable
-    changelog = ""
-    if version and version != "Newsletter":
-        changelog = get_changelog_section(version)
+    # Get commits, changelog and new commands (if we have a version range) concurrently
+    commits, changelog, new_commands = asyncio.run(
+        _gather_newsletter_inputs(since_date, until_date, version, from_version, to_version)
+    )
 
-    # Extract new commands and breaking changes if we have version info
-    new_commands = []
+    # Extract breaking changes if the changelog for this version is available
     breaking_changes = []
+    if changelog:
+        breaking_changes = extract_breaking_changes(changelog)
 
-    if from_version and to_version:
-        # Extract from actual version range
-        new_commands = extract_new_commands(from_version, to_version)
-        if changelog:
-            breaking_changes = extract_breaking_changes(changelog)
-    elif version and version != "Newsletter":
-        # Try to extract from changelog if version is available
-        if changelog:
-            breaking_changes = extract_breaking_changes(changelog)
+    # Trim prompt inputs once, up front (git already caps commits at MAX_COMMITS)
+    commits = commits[:MAX_COMMITS]
+    changelog = changelog[:MAX_CHANGELOG_CHARS]
 
     # Determine AI model
     if model is None: